@@ -1,8 +1,9 @@
 import pygame
 import random
+from collections import OrderedDict
 from constants import *
 from utils import *
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from utils import wrap_position
 
 
@@ -71,28 +72,144 @@ class Asteroid(pygame.sprite.Sprite):
                 fragments.append(Asteroid(self.pos, self.size - 1, new_vel))
         return fragments
     
+# Pre-baked explosion animations, keyed by (colors, variant)
+_explosion_sheets: "OrderedDict[tuple, ExplosionSheet]" = OrderedDict()
+# Keys baked by prebake_explosion_sheets(), never evicted
+_pinned_sheets = set()
+
+
+def _spawn_explosion_particles(pos: pygame.Vector2, colors: Tuple[Tuple[int,int,int], ...],
+                               rng: Optional[random.Random] = None) -> List[Particle]:
+    if rng is None:
+        rng = random
+    particles = []
+    for _ in range(EXPLOSION_PARTICLE_COUNT):
+        angle = rng.uniform(0, 360)
+        speed = rng.uniform(1.0, 5.0)
+        vel = pygame.Vector2(speed, 0).rotate(angle)
+        size = rng.uniform(2, 6)
+        lifetime = rng.uniform(0.4, EXPLOSION_LIFETIME)
+        color = rng.choice(colors)
+        particles.append(Particle(pos, vel, size, lifetime, color))
+    return particles
+
+
+class ExplosionSheet:
+    """
+    Explosion simulée une seule fois, à FPS images par seconde.
+    Chaque frame est une liste clairsemée de (sprite, offset) par particule
+    visible, rejouée en un seul appel à Surface.blits().
+    """
+    def __init__(self, colors: Tuple[Tuple[int,int,int], ...], variant: int):
+        # Per frame: (offset, radius, alpha, color) of each live particle
+        self._states: List[List[Tuple[pygame.Vector2, float, int, Tuple[int,int,int]]]] = []
+        self._sprites: Dict[Tuple, pygame.Surface] = {}
+        self._frames: Dict[int, List[List[Tuple[pygame.Surface, pygame.Vector2]]]] = {}
+        self._simulate(colors, random.Random(variant))
+
+    def _simulate(self, colors, rng: random.Random):
+        particles = _spawn_explosion_particles(pygame.Vector2(0, 0), colors, rng)
+        dt = 1.0 / FPS
+        step = 256 // EXPLOSION_SHEET_ALPHA_LEVELS
+        while particles:
+            states = []
+            for p in particles:
+                alpha = max(0, min(255, int(255 * (p.lifetime / p.max_lifetime)))) // step * step
+                if alpha > 0:
+                    states.append((pygame.Vector2(p.pos), p.size, alpha, p.color))
+            if not states:
+                # Remaining particles have faded out, alpha only decreases
+                break
+            self._states.append(states)
+            particles[:] = [p for p in particles if p.update(dt)]
+
+    def _sprite(self, color: Tuple[int,int,int], radius: int, alpha: int) -> pygame.Surface:
+        key = (color, radius, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+            self._sprites[key] = sprite
+        return sprite
+
+    def frames(self, size: int) -> List[List[Tuple[pygame.Surface, pygame.Vector2]]]:
+        """Frames pour une taille d'astéroïde, dérivées de la simulation à l'échelle 1."""
+        frames = self._frames.get(size)
+        if frames is None:
+            scale = EXPLOSION_SIZE_SCALE[size]
+            frames = []
+            for states in self._states:
+                frame = []
+                for offset, p_size, alpha, color in states:
+                    radius = int(p_size * scale)
+                    if radius > 0:
+                        frame.append((self._sprite(color, radius, alpha),
+                                      offset * scale - pygame.Vector2(radius, radius)))
+                frames.append(frame)
+            self._frames[size] = frames
+        return frames
+
+    def draw(self, surface: pygame.Surface, pos: pygame.Vector2, size: int, elapsed: float):
+        frames = self.frames(size)
+        index = int(elapsed * FPS)
+        if index < len(frames):
+            surface.blits([(sprite, pos + offset) for sprite, offset in frames[index]], False)
+
+
+def get_explosion_sheet(colors: Tuple[Tuple[int,int,int], ...], variant: int) -> ExplosionSheet:
+    """
+    Retourne la sheet en cache, en la créant (et en évinçant la plus ancienne
+    non épinglée) si besoin. Un cache miss simule l'explosion dans la frame
+    courante : appeler prebake_explosion_sheets() hors de la boucle de jeu
+    pour chaque schéma de couleurs utilisé.
+    """
+    key = (tuple(colors), variant)
+    sheet = _explosion_sheets.get(key)
+    if sheet is None:
+        sheet = ExplosionSheet(key[0], variant)
+        _explosion_sheets[key] = sheet
+        evictable = [k for k in _explosion_sheets if k not in _pinned_sheets]
+        while len(evictable) > EXPLOSION_SHEET_CACHE_SIZE:
+            del _explosion_sheets[evictable.pop(0)]
+    else:
+        _explosion_sheets.move_to_end(key)
+    return sheet
+
+
+def prebake_explosion_sheets(colors: Tuple[Tuple[int,int,int], ...] = EXPLOSION_COLORS):
+    """Cuit et épingle toutes les variantes d'un schéma de couleurs (requiert un display actif)."""
+    for variant in range(EXPLOSION_SHEET_VARIANTS):
+        sheet = get_explosion_sheet(colors, variant)
+        _pinned_sheets.add((tuple(colors), variant))
+        for size in EXPLOSION_SIZE_SCALE:
+            sheet.frames(size)
+
+
 class Explosion:
-    def __init__(self, pos: pygame.Vector2):
+    def __init__(self, pos: pygame.Vector2, size: int = 3,
+                 colors: Tuple[Tuple[int,int,int], ...] = EXPLOSION_COLORS):
         self.pos = pygame.Vector2(pos)
         self.particles: List[Particle] = []
         self.duration = EXPLOSION_LIFETIME
-        self._create_particles()
-
-    def _create_particles(self):
-        for _ in range(EXPLOSION_PARTICLE_COUNT):
-            angle = random.uniform(0, 360)
-            speed = random.uniform(1.0, 5.0)
-            vel = pygame.Vector2(speed, 0).rotate(angle)
-            size = random.uniform(2, 6)
-            lifetime = random.uniform(0.4, self.duration)
-            color = random.choice(EXPLOSION_COLORS)
-            self.particles.append(Particle(self.pos, vel, size, lifetime, color))
+        self.elapsed = 0.0
+        self.size = size
+        self.sheet = None
+        if EXPLOSION_USE_SPRITE_SHEETS:
+            variant = random.randrange(EXPLOSION_SHEET_VARIANTS)
+            self.sheet = get_explosion_sheet(colors, variant)
+        else:
+            self.particles = _spawn_explosion_particles(self.pos, colors)
 
     def update(self, dt: float) -> bool:
         self.duration -= dt
-        self.particles[:] = [p for p in self.particles if p.update(dt)]
+        self.elapsed += dt
+        if self.sheet is None:
+            self.particles[:] = [p for p in self.particles if p.update(dt)]
         return self.duration > 0
 
     def draw(self, surface: pygame.Surface):
+        if self.sheet is not None:
+            self.sheet.draw(surface, self.pos, self.size, self.elapsed)
+            return
         for p in self.particles:
-            p.draw(surface)
\ No newline at end of file
+            p.draw(surface)
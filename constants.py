@@ -44,4 +44,11 @@ ASTEROID_SPAWN_INTERVAL = 5.0  # secondes
 ENGINE_PARTICLE_COUNT = 2
 ENGINE_PARTICLE_LIFETIME = (0.3, 0.8)  # random lifetime in seconds
 EXPLOSION_PARTICLE_COUNT = 30
-EXPLOSION_LIFETIME = 0.8  # duration in seconds
\ No newline at end of file
+EXPLOSION_LIFETIME = 0.8  # duration in seconds
+
+# Explosion sprite sheets (pre-baked particle animations)
+EXPLOSION_USE_SPRITE_SHEETS = True
+EXPLOSION_SHEET_VARIANTS = 3  # distinct animations per color scheme
+EXPLOSION_SHEET_CACHE_SIZE = 12  # extra sheets kept besides the pre-baked ones
+EXPLOSION_SHEET_ALPHA_LEVELS = 32  # fade steps, bounds the number of cached sprites
+EXPLOSION_SIZE_SCALE = {3: 1.0, 2: 0.7, 1: 0.45}  # sheet scale by asteroid size
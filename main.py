@@ -7,7 +7,7 @@ from constants import *
 from player import Player
 from shot import Shot
 from utils import wrap_position, Particle
-from asteroid import Asteroid, Explosion
+from asteroid import Asteroid, Explosion, prebake_explosion_sheets
 from asteroidfield import AsteroidField, StarBackground
 
 
@@ -45,6 +45,8 @@ class Game:
 
         # Dynamic explosions
         self.explosions: List[Explosion] = []
+        if EXPLOSION_USE_SPRITE_SHEETS:
+            prebake_explosion_sheets()
 
         # Game state
         self.game_over = False
@@ -115,7 +117,7 @@ class Game:
             pygame.sprite.collide_circle
         )
         for astro, shots_hit in hits.items():
-            self.explosions.append(Explosion(astro.pos))
+            self.explosions.append(Explosion(astro.pos, astro.size))
 
             # split astéroïde
             fragments = astro.split()